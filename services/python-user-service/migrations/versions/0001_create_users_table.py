@@ -0,0 +1,66 @@
+"""Create users table and indexes
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Offline (--sql) output has no connection to inspect and targets an empty database
+    if context.is_offline_mode() or not sa.inspect(op.get_bind()).has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True)),
+            sa.UniqueConstraint("email", name="users_email_key"),
+        )
+    else:
+        _adopt_create_all_schema()
+
+    op.create_index(
+        "users_list_covering",
+        "users",
+        ["id"],
+        postgresql_include=["name", "email", "created_at"],
+        if_not_exists=True,
+    )
+    op.create_index("users_created_at", "users", [sa.text("created_at DESC")], if_not_exists=True)
+
+
+def _adopt_create_all_schema():
+    """Bring a table created by the old model's create_all in line with this revision"""
+    inspector = sa.inspect(op.get_bind())
+    unique_constraints = {c["name"] for c in inspector.get_unique_constraints("users")}
+    indexes = {i["name"] for i in inspector.get_indexes("users")}
+
+    # The old model (unique=True, index=True) enforced email uniqueness only through the
+    # UNIQUE index ix_users_email; promote it to the constraint ON CONFLICT (email) relies on
+    if "users_email_key" not in unique_constraints:
+        if "ix_users_email" in indexes:
+            op.execute("ALTER TABLE users ADD CONSTRAINT users_email_key UNIQUE USING INDEX ix_users_email")
+        else:
+            op.create_unique_constraint("users_email_key", "users", ["email"])
+    elif "ix_users_email" in indexes:
+        op.drop_index("ix_users_email", table_name="users")
+
+    # Duplicate of the primary key B-tree
+    if "ix_users_id" in indexes:
+        op.drop_index("ix_users_id", table_name="users")
+
+
+def downgrade():
+    op.drop_index("users_created_at", table_name="users")
+    op.drop_index("users_list_covering", table_name="users")
+    op.drop_table("users")